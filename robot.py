@@ -1,82 +1,128 @@
+import re
+from typing import Final
+
+__all__ = ['Robot', 'Table', 'print_table']
+
+# Facing directions in clockwise order, so rotating is just index arithmetic
+_DIRS: Final = ('NORTH', 'EAST', 'SOUTH', 'WEST')
+_DIR_INDEX: Final = {direction: index for index, direction in enumerate(_DIRS)}
+# (dx, dy) for one step in each direction, ordered to match _DIRS
+_DELTAS: Final = ((0, 1), (1, 0), (0, -1), (-1, 0))
+# All valid board cells, so bounds checking is one hashed membership test
+_VALID_CELLS: Final = frozenset((x, y) for x in range(5) for y in range(5))
+# Every possible report string (5x5 positions, 4 facings), indexed by
+# (x * 5 + y) * 4 + facing index
+_REPORTS: Final = tuple(
+    f"{x}, {y}, {direction}"
+    for x in range(5)
+    for y in range(5)
+    for direction in _DIRS
+)
+
 class Robot:
+    __slots__ = ('x', 'y', '_facing_idx', 'is_placed')
+
     def __init__(self):
         self.x = None
         self.y = None
-        self.facing = None
+        self._facing_idx = None
+        self.is_placed = False
+
+    @property
+    def facing(self):
+        return _DIRS[self._facing_idx] if self._facing_idx is not None else None
 
     def place(self, x, y, facing):
-        if 0 <= x <= 4 and 0 <= y <= 4 and facing in ('NORTH', 'SOUTH', 'EAST', 'WEST'):
+        if (x, y) in _VALID_CELLS and facing in _DIR_INDEX:
             self.x = x
             self.y = y
-            self.facing = facing
+            self._facing_idx = _DIR_INDEX[facing]
+            self.is_placed = True
             return True  # Placement successful
         else:
             return False  # Invalid placement
 
     def move(self):
-        if self.facing == 'NORTH':
-            self.y = min(self.y + 1, 4)  # Stay within Y bounds
-        elif self.facing == 'SOUTH':
-            self.y = max(self.y - 1, 0)  # Stay within Y bounds
-        elif self.facing == 'EAST':
-            self.x = min(self.x + 1, 4)  # Stay within X bounds
-        elif self.facing == 'WEST':
-            self.x = max(self.x - 1, 0)  # Stay within X bounds
+        if not self.is_placed:
+            return
+        dx, dy = _DELTAS[self._facing_idx]
+        new_x = self.x + dx
+        new_y = self.y + dy
+        if 0 <= new_x <= 4:  # Stay within X bounds
+            self.x = new_x
+        if 0 <= new_y <= 4:  # Stay within Y bounds
+            self.y = new_y
 
     def left(self):
-        directions = ['NORTH', 'EAST', 'SOUTH', 'WEST']
-        self.facing = directions[(directions.index(self.facing) - 1) % 4]
+        self._facing_idx = (self._facing_idx - 1) & 3
 
     def right(self):
-        directions = ['NORTH', 'EAST', 'SOUTH', 'WEST']
-        self.facing = directions[(directions.index(self.facing) + 1) % 4]
+        self._facing_idx = (self._facing_idx + 1) & 3
 
     def report(self):
-        if self.x is not None and self.y is not None:  # Check if placed
-            return f"{self.x}, {self.y}, {self.facing}"
+        if self.is_placed:
+            return _REPORTS[(self.x * 5 + self.y) * 4 + self._facing_idx]
         else:
             return "Not placed"
 
+# PLACE argument parser, compiled once: "PLACE x,y,FACING"
+_PLACE_RE: Final = re.compile(r"PLACE\s+(\d+)\s*,\s*(\d+)\s*,\s*(NORTH|SOUTH|EAST|WEST)")
+
 class Table:
+    __slots__ = ('robot', '_actions')
+
     def __init__(self):
         self.robot = Robot()
+        # Movement commands pre-bound to the robot with their response
+        # messages, so dispatch is one lookup and one call
+        self._actions = {
+            'MOVE': (self.robot.move, "Move successful."),
+            'LEFT': (self.robot.left, "LEFT successful."),
+            'RIGHT': (self.robot.right, "RIGHT successful."),
+        }
 
     def process_command(self, command):
         parts = command.split()
+        if not parts:
+            return "Invalid command."
         if parts[0] == 'PLACE':
-            x, y, facing = map(str.strip, parts[1].split(','))
-            if self.robot.place(int(x), int(y), facing):
+            match = _PLACE_RE.fullmatch(command)
+            if match and self.robot.place(int(match[1]), int(match[2]), match[3]):
                 return "Robot placed successfully."
             else:
                 return "Invalid placement."
-        elif parts[0] == 'MOVE' and self.robot.x is not None:  # Check if placed
-            self.robot.move()
-            return "Move successful."
-        elif parts[0] in ('LEFT', 'RIGHT') and self.robot.x is not None:
-            getattr(self.robot, parts[0].lower())()  # Call left or right method
-            return f"{parts[0]} successful."
-        elif parts[0] == 'REPORT' and self.robot.x is not None:
-            return self.robot.report()
-        else:
-            return "Invalid command."
+        if self.robot.is_placed:
+            if parts[0] == 'REPORT':
+                return self.robot.report()
+            action = self._actions.get(parts[0])
+            if action is not None:
+                do, message = action
+                do()
+                return message
+        return "Invalid command."
+
+    def process_commands(self, commands):
+        # Batch entry point: resolve the bound method once, then loop
+        process = self.process_command
+        return [process(command) for command in commands]
+
+_ROW_SEPARATOR: Final = "+---+---+---+---+---+"
 
 def print_table(robot):
+    x, y = robot.x, robot.y
+    lines = []
     for row in range(4, -1, -1):
-        row_str = "|"
-        for col in range(5):
-            if robot.x == col and robot.y == row:
-                row_str += " 🤖"
-            else:
-                row_str += "   "
-            row_str += "|"
-        print(row_str)
+        cells = "".join(" 🤖|" if x == col and y == row else "   |" for col in range(5))
+        lines.append("|" + cells)
         if row > 0:
-            print("+---+---+---+---+---+")
+            lines.append(_ROW_SEPARATOR)
+    print("\n".join(lines))
 
 # Main Interaction
-table = Table()
-while True:
-    cmd = input("Enter command: ")
-    result = table.process_command(cmd)
-    print(result)
-    print_table(table.robot)
+if __name__ == '__main__':
+    table = Table()
+    while True:
+        cmd = input("Enter command: ")
+        result = table.process_command(cmd)
+        print(result)
+        print_table(table.robot)
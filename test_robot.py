@@ -1,31 +1,42 @@
-import unittest
+import pytest
 from robot import Table
 
-class TestRobotTable(unittest.TestCase):
-    def setUp(self):
-        self.table = Table()
+@pytest.fixture
+def table():
+    return Table()
 
-    def test_place_command(self):
-        self.assertEqual(self.table.process_command("PLACE 0,0,NORTH"), "Robot placed successfully.")
-        self.assertEqual(self.table.process_command("REPORT"), "0, 0, NORTH")
+def test_place_command(table):
+    assert table.process_command("PLACE 0,0,NORTH") == "Robot placed successfully."
+    assert table.process_command("REPORT") == "0, 0, NORTH"
 
-    def test_move_command(self):
-        self.table.process_command("PLACE 0,0,NORTH")
-        self.assertEqual(self.table.process_command("MOVE"), "Move successful.")
-        self.assertEqual(self.table.process_command("REPORT"), "0, 1, NORTH")
+def test_command_messages(table):
+    table.process_command("PLACE 0,0,NORTH")
+    assert table.process_command("MOVE") == "Move successful."
+    assert table.process_command("LEFT") == "LEFT successful."
+    assert table.process_command("RIGHT") == "RIGHT successful."
 
-    def test_left_command(self):
-        self.table.process_command("PLACE 0,0,NORTH")
-        self.assertEqual(self.table.process_command("LEFT"), "LEFT successful.")
-        self.assertEqual(self.table.process_command("REPORT"), "0, 0, WEST")
+@pytest.mark.parametrize("commands,expected", [
+    (["PLACE 0,0,NORTH", "MOVE"], "0, 1, NORTH"),
+    (["PLACE 0,0,NORTH", "LEFT"], "0, 0, WEST"),
+    (["PLACE 1,2,EAST", "MOVE", "MOVE", "LEFT", "MOVE"], "3, 3, NORTH"),
+])
+def test_command_sequence(table, commands, expected):
+    for command in commands:
+        table.process_command(command)
+    assert table.process_command("REPORT") == expected
 
-    def test_complex_commands(self):
-        self.assertEqual(self.table.process_command("PLACE 1,2,EAST"), "Robot placed successfully.")
-        self.assertEqual(self.table.process_command("MOVE"), "Move successful.")
-        self.assertEqual(self.table.process_command("MOVE"), "Move successful.")
-        self.assertEqual(self.table.process_command("LEFT"), "LEFT successful.")
-        self.assertEqual(self.table.process_command("MOVE"), "Move successful.")
-        self.assertEqual(self.table.process_command("REPORT"), "3, 3, NORTH")
+@pytest.mark.parametrize("command", [
+    pytest.param("PLACE -1,0,NORTH", id="x_neg"),
+    pytest.param("PLACE 5,0,NORTH", id="x_big"),
+    pytest.param("PLACE 0,-1,NORTH", id="y_neg"),
+    pytest.param("PLACE 0,5,NORTH", id="y_big"),
+    pytest.param("PLACE 0,0,NORTHWEST", id="bad_dir"),
+])
+def test_place_invalid(table, command):
+    assert table.process_command(command) == "Invalid placement."
+    assert not table.robot.is_placed
 
-if __name__ == '__main__':
-    unittest.main()
+def test_process_commands_batch(table):
+    results = table.process_commands(["PLACE 1,2,EAST", "MOVE", "LEFT", "REPORT"])
+    assert results[0] == "Robot placed successfully."
+    assert results[-1] == "2, 2, NORTH"